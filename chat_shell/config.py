@@ -12,6 +12,12 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Prefix every OpenAI secret key starts with
+_API_KEY_PREFIX = "sk-"
+
+# Accepted (casefolded) values for boolean environment flags
+_TRUTHY = frozenset({"true"})
+
 
 class OpenAIConfig(BaseModel):
     """OpenAI configuration."""
@@ -35,15 +41,13 @@ class Config(BaseModel):
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
     storage: StorageConfig = Field(default_factory=StorageConfig)
     show_thinking: bool = Field(
-        default_factory=lambda: os.getenv("CHAT_SHELL_SHOW_THINKING", "false").lower() == "true"
+        default_factory=lambda: os.getenv("CHAT_SHELL_SHOW_THINKING", "").casefold() in _TRUTHY
     )
 
     def validate_api_key(self) -> bool:
         """Validate that OpenAI API key is set."""
-        if not self.openai.api_key:
-            return False
-        # Basic validation - key should start with 'sk-'
-        return self.openai.api_key.startswith("sk-")
+        # Basic validation - an empty key can never carry the 'sk-' prefix
+        return self.openai.api_key.startswith(_API_KEY_PREFIX)
 
     def get_storage_path(self) -> Path:
         """Get the storage path, creating it if it doesn't exist."""
@@ -2,14 +2,20 @@
 Storage interfaces for chat history.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional, Literal
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Literal
 from pathlib import Path
 
+# Stored timestamps count microseconds of wall-clock time from this point, so
+# reading them back does not depend on the process's local timezone
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
 
-@dataclass
+
+@dataclass(slots=True)
 class Message:
     """A chat message."""
     role: Literal["user", "assistant", "system"]
@@ -20,18 +26,82 @@ class Message:
         if self.timestamp is None:
             self.timestamp = datetime.now()
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dict with the timestamp as epoch microseconds.
+
+        ``ts_us`` holds the wall-clock time; aware timestamps also store
+        their UTC offset in seconds as ``tz``.
+        """
+        data = {
+            "role": self.role,
+            "content": self.content,
+            "ts_us": (self.timestamp.replace(tzinfo=None) - _EPOCH)
+            // _ONE_MICROSECOND,
+        }
+        offset = self.timestamp.utcoffset()
+        if offset is not None:
+            data["tz"] = int(offset.total_seconds())
+        return data
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        timestamp_cache: Optional[Dict[int, datetime]] = None,
+    ) -> "Message":
+        """Create a message from a dict produced by to_dict().
+
+        Skips __init__/__post_init__ since stored records are already
+        well-formed; this is the hot path when loading long histories.
+        Passing the same timestamp_cache across a batch lets messages
+        written within the same second share one datetime construction.
+        """
+        message = object.__new__(cls)
+        # Parsed roles are fresh strings; interning makes them shared objects
+        message.role = sys.intern(data["role"])
+        message.content = data["content"]
+        ts_us = data.get("ts_us")
+        if ts_us is None:
+            message.timestamp = datetime.now()
+            return message
+
+        seconds, microseconds = divmod(ts_us, 1_000_000)
+        if timestamp_cache is None:
+            base = _EPOCH + timedelta(seconds=seconds)
+        else:
+            base = timestamp_cache.get(seconds)
+            if base is None:
+                base = timestamp_cache[seconds] = _EPOCH + timedelta(seconds=seconds)
+        tz = data.get("tz")
+        if tz is None:
+            message.timestamp = base.replace(microsecond=microseconds)
+        else:
+            message.timestamp = base.replace(
+                microsecond=microseconds, tzinfo=timezone(timedelta(seconds=tz))
+            )
+        return message
+
 
 class HistoryStorage(ABC):
     """Abstract base class for history storage."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def get_history(self, session_id: str) -> List[Message]:
         """Get all messages for a session."""
         pass
 
     @abstractmethod
-    async def append_messages(self, session_id: str, messages: List[Message]) -> None:
-        """Append messages to a session."""
+    async def append_messages(
+        self, session_id: str, messages: Iterable[Message]
+    ) -> None:
+        """Append messages to a session.
+
+        ``messages`` may be any iterable (e.g. a generator); it is consumed
+        once, on the calling event loop. Backends may collect it into a list
+        before writing, so this does not bound memory use per call.
+        """
         pass
 
     @abstractmethod
@@ -2,113 +2,350 @@
 JSON file storage implementation.
 """
 
-import json
 import asyncio
+import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Iterable, Iterator, List, Literal, Optional
 from datetime import datetime
 
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from .interfaces import Message, HistoryStorage, StorageProvider
 from ..config import config
 
 
 class JSONHistoryStorage(HistoryStorage):
-    """JSON file-based history storage."""
+    """JSON file-based history storage.
+
+    Each session is stored as newline-delimited JSON (one message per line),
+    so appending only writes the new messages instead of rewriting the whole
+    history. Session files written in the older single-document format are
+    converted on first access.
 
-    def __init__(self, storage_path: Path):
+    Writers hold an exclusive advisory lock per session (POSIX only), so
+    several processes can share one storage path without interleaving
+    appends or racing a legacy conversion.
+
+    With ``compression="zstd"`` (requires the ``zstandard`` package) each
+    append is written as its own checksummed zstd frame to
+    ``{session_id}.jsonl.zst``. A damaged frame only loses its own messages.
+    Sessions written with the other setting are converted on first access,
+    so compression can be switched on or off for an existing storage path
+    (switching it off needs ``zstandard`` to read the compressed files).
+    """
+
+    def __init__(
+        self, storage_path: Path, compression: Optional[Literal["zstd"]] = None
+    ):
+        if compression not in (None, "zstd"):
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ImportError(
+                "zstd compression is not available. "
+                "Install with: pip install code-agent[zstd]"
+            )
         self.storage_path = storage_path
+        self.compression = compression
+        self._suffix = ".jsonl.zst" if compression == "zstd" else ".jsonl"
         self.sessions_path = storage_path / "sessions"
         self.sessions_path.mkdir(parents=True, exist_ok=True)
+        self._session_files: Dict[str, Path] = {}
 
     def _get_session_file(self, session_id: str) -> Path:
         """Get the session file path."""
+        session_file = self._session_files.get(session_id)
+        if session_file is None:
+            session_file = self.sessions_path / f"{session_id}{self._suffix}"
+            self._session_files[session_id] = session_file
+        return session_file
+
+    def _get_legacy_session_file(self, session_id: str) -> Path:
+        """Get the path of a session file in the single-document format."""
         return self.sessions_path / f"{session_id}.json"
 
-    async def get_history(self, session_id: str) -> List[Message]:
-        """Get all messages for a session."""
+    def _get_other_format_file(self, session_id: str) -> Optional[Path]:
+        """Get the NDJSON session file written with the other compression setting.
+
+        Returns None when that file could not be read here.
+        """
+        if self.compression == "zstd":
+            return self.sessions_path / f"{session_id}.jsonl"
+        if zstandard is None:
+            return None
+        return self.sessions_path / f"{session_id}.jsonl.zst"
+
+    def _get_lock_file(self, session_id: str) -> Path:
+        """Get the path of a session's lock file."""
+        return self.sessions_path / f"{session_id}.lock"
+
+    @contextmanager
+    def _session_lock(self, session_id: str) -> Iterator[None]:
+        """Hold an exclusive lock on a session while modifying its files."""
+        if fcntl is None:
+            yield
+            return
+
+        lock_file = self._get_lock_file(session_id)
+        while True:
+            f = lock_file.open("ab")
+            fcntl.flock(f, fcntl.LOCK_EX)
+            # Clearing a session removes its lock file; a lock taken on the
+            # removed file no longer excludes anyone, so retry on a new one
+            try:
+                current = os.stat(lock_file)
+            except FileNotFoundError:
+                current = None
+            if current is not None and current.st_ino == os.fstat(f.fileno()).st_ino:
+                break
+            f.close()
+
+        # Released when the file is closed
+        with f:
+            yield
+
+    def _migrate_legacy_session(self, session_id: str) -> bool:
+        """Convert a session file in another format, if one exists.
+
+        Handles single-document files and NDJSON files written with the
+        other compression setting. Must be called with the session lock
+        held. Returns whether the session has an NDJSON file afterwards.
+        """
         session_file = self._get_session_file(session_id)
-        if not session_file.exists():
-            return []
+        if session_file.exists():
+            # Converted by another writer in the meantime
+            return True
+
+        other_file = self._get_other_format_file(session_id)
+        if other_file is not None and other_file.exists():
+            payload = other_file.read_bytes()
+            if self.compression == "zstd":
+                payload = self._compress(payload)
+            else:
+                payload = self._decompress_frames(payload, other_file)
+            self._replace_session_file(session_file, payload)
+            other_file.unlink()
+            return True
+
+        legacy_file = self._get_legacy_session_file(session_id)
+        if not legacy_file.exists():
+            return False
+
+        data = orjson.loads(legacy_file.read_bytes())
+        messages = []
+        parsed_timestamps: Dict[str, datetime] = {}
+        for msg_data in data.get("messages", []):
+            # Parse timestamp if present, once per distinct string
+            timestamp = None
+            raw_timestamp = msg_data.get("timestamp")
+            if raw_timestamp:
+                timestamp = parsed_timestamps.get(raw_timestamp)
+                if timestamp is None:
+                    timestamp = datetime.fromisoformat(raw_timestamp)
+                    parsed_timestamps[raw_timestamp] = timestamp
+            messages.append(Message(
+                role=msg_data["role"],
+                content=msg_data["content"],
+                timestamp=timestamp
+            ))
+
+        self._replace_session_file(session_file, self._compress(self._encode(messages)))
+        legacy_file.unlink()
+        return True
+
+    @staticmethod
+    def _replace_session_file(session_file: Path, content: bytes) -> None:
+        """Write a converted session file atomically."""
+        # Write aside and rename into place, so an interrupted conversion
+        # never leaves a partial NDJSON file behind
+        tmp_file = session_file.with_name(f"{session_file.name}.tmp")
+        tmp_file.write_bytes(content)
+        os.replace(tmp_file, session_file)
+
+    @staticmethod
+    def _encode(messages: Iterable[Message]) -> bytes:
+        """Encode messages as NDJSON lines."""
+        return b"".join(orjson.dumps(msg.to_dict()) + b"\n" for msg in messages)
+
+    def _compress(self, payload: bytes) -> bytes:
+        """Compress an encoded payload for writing, if compression is enabled."""
+        if self.compression == "zstd":
+            # The checksum lets readers detect a frame damaged by a crash
+            compressor = zstandard.ZstdCompressor(level=1, write_checksum=True)
+            return compressor.compress(payload)
+        return payload
+
+    def _decompress(self, content: bytes, session_file: Path) -> bytes:
+        """Decompress the raw contents of a session file."""
+        if self.compression == "zstd":
+            return self._decompress_frames(content, session_file)
+        return content
 
+    @staticmethod
+    def _decompress_frames(content: bytes, session_file: Path) -> bytes:
+        """Decode a file of zstd frames one at a time.
+
+        Every append adds a frame. A frame that fails to decode is skipped
+        by resuming at the next frame magic number, so one damaged append
+        does not hide the rest of the session.
+        """
+        magic = zstandard.MAGIC_NUMBER.to_bytes(4, "little")
+        decompressor = zstandard.ZstdDecompressor()
+        chunks = []
+        pos = 0
+        while pos < len(content):
+            frame = decompressor.decompressobj()
+            try:
+                data = frame.decompress(content[pos:])
+            except zstandard.ZstdError as e:
+                data, error = b"", e
+            else:
+                if frame.eof:
+                    chunks.append(data)
+                    pos = len(content) - len(frame.unused_data)
+                    continue
+                error = "frame is truncated"
+
+            print(f"Skipping damaged frame in session file {session_file}: {error}")
+            pos = content.find(magic, pos + 1)
+            if pos == -1:
+                # A final frame cut short by a crash keeps what it decoded to
+                chunks.append(data)
+                break
+        return b"".join(chunks)
+
+    def _read_session(self, session_id: str) -> List[Message]:
+        """Read all messages of a session file."""
+        session_file = self._get_session_file(session_id)
         try:
-            # Use asyncio to read file asynchronously
-            loop = asyncio.get_event_loop()
-            content = await loop.run_in_executor(None, session_file.read_text)
-            data = json.loads(content)
-
-            messages = []
-            for msg_data in data.get("messages", []):
-                # Parse timestamp if present
-                timestamp = None
-                if "timestamp" in msg_data:
-                    timestamp = datetime.fromisoformat(msg_data["timestamp"])
-
-                messages.append(Message(
-                    role=msg_data["role"],
-                    content=msg_data["content"],
-                    timestamp=timestamp
-                ))
-            return messages
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error reading session file {session_file}: {e}")
-            return []
+            content = session_file.read_bytes()
+        except FileNotFoundError:
+            other_file = self._get_other_format_file(session_id)
+            unconverted = (
+                self._get_legacy_session_file(session_id).exists()
+                or (other_file is not None and other_file.exists())
+            )
+            if not unconverted:
+                return []
+            with self._session_lock(session_id):
+                if not self._migrate_legacy_session(session_id):
+                    return []
+            content = session_file.read_bytes()
+        content = self._decompress(content, session_file)
 
-    async def append_messages(self, session_id: str, messages: List[Message]) -> None:
-        """Append messages to a session."""
+        messages = []
+        timestamp_cache: Dict[int, datetime] = {}
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                messages.append(Message.from_dict(orjson.loads(line), timestamp_cache))
+            except (
+                orjson.JSONDecodeError, KeyError, TypeError, ValueError, OverflowError
+            ) as e:
+                # Skip damaged lines (e.g. a write interrupted mid-line)
+                print(f"Skipping invalid line in session file {session_file}: {e}")
+        return messages
+
+    def _append_session(self, session_id: str, messages: Iterable[Message]) -> None:
+        """Append messages to a session file."""
         session_file = self._get_session_file(session_id)
+        # Encode before locking so the lock only covers the actual file I/O
+        payload = self._encode(messages)
+        if not payload:
+            # Nothing to write; don't touch the lock or session file
+            return
+
+        with self._session_lock(session_id):
+            try:
+                self._migrate_legacy_session(session_id)
+            except orjson.JSONDecodeError as e:
+                # Start a fresh history rather than blocking all future writes
+                print(f"Ignoring unreadable legacy session file for {session_id}: {e}")
+
+            with session_file.open("ab") as f:
+                f.write(self._compress(payload))
+
+    def _delete_session(self, session_id: str) -> None:
+        """Delete a session file in any format, along with its lock file."""
+        session_files = (
+            self._get_session_file(session_id),
+            self._get_legacy_session_file(session_id),
+            self._get_other_format_file(session_id),
+        )
+        session_files = [path for path in session_files if path is not None]
+        lock_file = self._get_lock_file(session_id)
+        if not any(path.exists() for path in (*session_files, lock_file)):
+            return
 
-        # Get existing messages
-        existing_messages = await self.get_history(session_id)
-        all_messages = existing_messages + messages
-
-        # Convert to serializable format
-        serializable_messages = []
-        for msg in all_messages:
-            msg_dict = {
-                "role": msg.role,
-                "content": msg.content,
-                "timestamp": msg.timestamp.isoformat() if msg.timestamp else None
-            }
-            serializable_messages.append(msg_dict)
-
-        data = {
-            "session_id": session_id,
-            "updated_at": datetime.now().isoformat(),
-            "messages": serializable_messages
-        }
+        with self._session_lock(session_id):
+            for session_file in session_files:
+                if session_file.exists():
+                    session_file.unlink()
+            # Removed while still held, so waiting writers retry on a new file
+            lock_file.unlink(missing_ok=True)
 
+    async def get_history(self, session_id: str) -> List[Message]:
+        """Get all messages for a session."""
         try:
-            # Use asyncio to write file asynchronously
-            loop = asyncio.get_event_loop()
-            json_data = json.dumps(data, indent=2, ensure_ascii=False)
-            await loop.run_in_executor(None, session_file.write_text, json_data)
-        except IOError as e:
-            print(f"Error writing session file {session_file}: {e}")
+            return await asyncio.to_thread(self._read_session, session_id)
+        except (orjson.JSONDecodeError, IOError) as e:
+            print(f"Error reading session {session_id}: {e}")
+            return []
+
+    async def append_messages(
+        self, session_id: str, messages: Iterable[Message]
+    ) -> None:
+        """Append messages to a session."""
+        # Materialize on the event loop: generators may touch loop-bound state
+        # and must not be advanced from the worker thread
+        messages = list(messages)
+        if not messages:
+            return
+
+        try:
+            await asyncio.to_thread(self._append_session, session_id, messages)
+        except (orjson.JSONDecodeError, IOError) as e:
+            print(f"Error writing session {session_id}: {e}")
 
     async def clear_history(self, session_id: str) -> None:
         """Clear history for a session."""
-        session_file = self._get_session_file(session_id)
-        if session_file.exists():
-            try:
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, session_file.unlink)
-            except IOError as e:
-                print(f"Error deleting session file {session_file}: {e}")
+        try:
+            await asyncio.to_thread(self._delete_session, session_id)
+        except IOError as e:
+            print(f"Error deleting session {session_id}: {e}")
 
 
 class JSONStorage(StorageProvider):
     """JSON file storage provider."""
 
-    def __init__(self, storage_path: Path = None):
+    def __init__(
+        self,
+        storage_path: Path = None,
+        compression: Optional[Literal["zstd"]] = None,
+    ):
         if storage_path is None:
             storage_path = config.get_storage_path()
         self.storage_path = storage_path
+        self.compression = compression
         self._history_storage = None
 
     async def initialize(self) -> None:
         """Initialize the storage provider."""
-        self.storage_path.mkdir(parents=True, exist_ok=True)
-        self._history_storage = JSONHistoryStorage(self.storage_path)
+        # JSONHistoryStorage creates storage_path/sessions (and its parents)
+        self._history_storage = JSONHistoryStorage(
+            self.storage_path, compression=self.compression
+        )
 
     async def close(self) -> None:
         """Close the storage provider."""
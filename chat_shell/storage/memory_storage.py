@@ -2,25 +2,36 @@
 In-memory storage implementation.
 """
 
-from typing import List, Dict
+from collections import deque
+from typing import Deque, Iterable, List, Dict
 from .interfaces import Message, HistoryStorage, StorageProvider
 
 
 class MemoryHistoryStorage(HistoryStorage):
     """In-memory history storage."""
 
+    __slots__ = ("sessions",)
+
     def __init__(self):
-        self.sessions: Dict[str, List[Message]] = {}
+        self.sessions: Dict[str, Deque[Message]] = {}
 
     async def get_history(self, session_id: str) -> List[Message]:
         """Get all messages for a session."""
-        return self.sessions.get(session_id, [])
+        return list(self.sessions.get(session_id, ()))
 
-    async def append_messages(self, session_id: str, messages: List[Message]) -> None:
+    async def append_messages(
+        self, session_id: str, messages: Iterable[Message]
+    ) -> None:
         """Append messages to a session."""
-        if session_id not in self.sessions:
-            self.sessions[session_id] = []
-        self.sessions[session_id].extend(messages)
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.extend(messages)
+            return
+
+        # Only store a new session once the iterable turned out non-empty
+        session = deque(messages)
+        if session:
+            self.sessions[session_id] = session
 
     async def clear_history(self, session_id: str) -> None:
         """Clear history for a session."""
@@ -5,7 +5,7 @@ Remote storage implementation for HTTP mode backend integration.
 import asyncio
 import httpx
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from .interfaces import Message, HistoryStorage, StorageProvider
 
@@ -68,7 +68,9 @@ class RemoteHistoryStorage(HistoryStorage):
             )
         return messages
 
-    async def append_messages(self, session_id: str, messages: List[Message]) -> None:
+    async def append_messages(
+        self, session_id: str, messages: Iterable[Message]
+    ) -> None:
         """Append messages via remote API."""
         if not self._client:
             raise RuntimeError("Storage not initialized")
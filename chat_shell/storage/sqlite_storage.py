@@ -6,7 +6,7 @@ import asyncio
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from .interfaces import Message, HistoryStorage, StorageProvider
 
@@ -103,8 +103,13 @@ class SQLiteHistoryStorage(HistoryStorage):
 
         return await asyncio.to_thread(_get)
 
-    async def append_messages(self, session_id: str, messages: List[Message]) -> None:
+    async def append_messages(
+        self, session_id: str, messages: Iterable[Message]
+    ) -> None:
         """Append messages to a session."""
+        # Materialize on the event loop: generators may touch loop-bound state
+        # and must not be advanced from the worker thread
+        messages = list(messages)
 
         def _append():
             conn = self._get_connection()
@@ -5,7 +5,7 @@ Tool registry for managing available tools.
 import importlib
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Type, Callable, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Callable, Any
 import inspect
 
 from .base import BaseTool
@@ -24,6 +24,14 @@ class ToolRegistry:
         self._pre_load_hooks: List[Callable[[BaseTool], None]] = []
         self._post_load_hooks: List[Callable[[BaseTool], None]] = []
         self._pre_unload_hooks: List[Callable[[BaseTool], None]] = []
+        # Views of the current tool set, rebuilt lazily after changes
+        self._tool_names: Optional[Tuple[str, ...]] = None
+        self._langchain_tools: Optional[Tuple[Any, ...]] = None
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached views after the tool set changed."""
+        self._tool_names = None
+        self._langchain_tools = None
 
     def register(self, tool: BaseTool, allow_replace: bool = False) -> None:
         """Register a tool.
@@ -35,6 +43,39 @@ class ToolRegistry:
         Raises:
             ToolRegistrationError: If tool is invalid or already registered
         """
+        self._validate_tool(tool, allow_replace)
+        self._add_tool(tool)
+
+    def register_many(
+        self, tools: Iterable[BaseTool], allow_replace: bool = False
+    ) -> None:
+        """Register several tools at once.
+
+        All tools are validated before any is added, so a rejected batch
+        leaves the registry unchanged.
+
+        Args:
+            tools: The tool instances to register
+            allow_replace: Whether to allow replacing existing tools
+
+        Raises:
+            ToolRegistrationError: If any tool is invalid or already registered
+        """
+        tools = list(tools)
+        batch_names = set()
+        for tool in tools:
+            self._validate_tool(tool, allow_replace)
+            if tool.name in batch_names and not allow_replace:
+                raise ToolRegistrationError(
+                    f"Tool '{tool.name}' appears more than once in the batch."
+                )
+            batch_names.add(tool.name)
+
+        for tool in tools:
+            self._add_tool(tool)
+
+    def _validate_tool(self, tool: BaseTool, allow_replace: bool) -> None:
+        """Check that a tool can be registered."""
         if not isinstance(tool, BaseTool):
             raise ToolRegistrationError(
                 f"Tool must inherit from BaseTool, got {type(tool)}"
@@ -48,6 +89,8 @@ class ToolRegistry:
                 f"Tool '{tool.name}' is already registered. Use allow_replace=True to override."
             )
 
+    def _add_tool(self, tool: BaseTool) -> None:
+        """Store a validated tool and run the load hooks around it."""
         # Run pre-load hooks
         for hook in self._pre_load_hooks:
             try:
@@ -57,6 +100,8 @@ class ToolRegistry:
 
         self._tools[tool.name] = tool
         self._tool_classes[tool.name] = type(tool)
+        # Before the post-load hooks, which may read the registry
+        self._invalidate_caches()
 
         # Run post-load hooks
         for hook in self._post_load_hooks:
@@ -90,6 +135,7 @@ class ToolRegistry:
 
         del self._tools[name]
         del self._tool_classes[name]
+        self._invalidate_caches()
         logger.info(f"Unregistered tool: {name}")
 
     def get_tool(self, name: str) -> BaseTool:
@@ -119,13 +165,19 @@ class ToolRegistry:
         """
         return name in self._tools
 
+    def __contains__(self, name: str) -> bool:
+        """Support ``name in registry`` as a shorthand for has_tool()."""
+        return name in self._tools
+
     def get_all_tools(self) -> List[BaseTool]:
         """Get all registered tools."""
         return list(self._tools.values())
 
-    def get_tool_names(self) -> List[str]:
-        """Get names of all registered tools."""
-        return list(self._tools.keys())
+    def get_tool_names(self) -> Tuple[str, ...]:
+        """Get names of all registered tools, in registration order."""
+        if self._tool_names is None:
+            self._tool_names = tuple(self._tools)
+        return self._tool_names
 
     def get_tool_schemas(self) -> Dict[str, Dict]:
         """Get JSON schemas for all tools."""
@@ -240,8 +292,16 @@ class ToolRegistry:
         """Add a hook to run before tool unregistration."""
         self._pre_unload_hooks.append(hook)
 
-    def to_langchain_tools(self):
-        """Convert tools to LangChain tool format."""
+    def to_langchain_tools(self) -> Tuple[Any, ...]:
+        """Convert tools to LangChain tool format.
+
+        The converted tools are cached until a tool is registered or
+        unregistered. Repeated calls return the same tuple, which is
+        immutable so callers cannot change what later callers receive.
+        """
+        if self._langchain_tools is not None:
+            return self._langchain_tools
+
         from langchain.tools import tool as langchain_tool
         langchain_tools = []
 
@@ -266,7 +326,8 @@ class ToolRegistry:
             )
             langchain_tools.append(lc_tool)
 
-        return langchain_tools
+        self._langchain_tools = tuple(langchain_tools)
+        return self._langchain_tools
 
 
 # Global tool registry instance
@@ -0,0 +1,34 @@
+"""Fixtures for storage tests."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from chat_shell.storage.interfaces import Message
+
+
+SAMPLE_MESSAGES = (
+    Message(role="system", content="You are a helpful assistant.",
+            timestamp=datetime(2024, 1, 1, 12, 0, 0)),
+    Message(role="user", content="Hello",
+            timestamp=datetime(2024, 1, 1, 12, 0, 1)),
+    Message(role="assistant", content="Hi there!",
+            timestamp=datetime(2024, 1, 1, 12, 0, 2)),
+)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async storage tests on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture
+def sample_messages():
+    """Return a fresh list of the shared sample messages."""
+    return list(SAMPLE_MESSAGES)
@@ -0,0 +1,229 @@
+"""
+Tests for storage interfaces - Epic 6: Storage Layer.
+"""
+
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+
+from chat_shell.storage.interfaces import Message, HistoryStorage, StorageProvider
+
+
+pytestmark = [pytest.mark.chat_shell, pytest.mark.unit, pytest.mark.epic_6]
+
+LONG_CONTENT = "A" * 1000
+
+
+class ConcreteHistoryStorage(HistoryStorage):
+    """Minimal in-memory HistoryStorage used to exercise the interface."""
+
+    __slots__ = ("_storage",)
+
+    def __init__(self):
+        self._storage = defaultdict(list)
+
+    async def get_history(self, session_id: str) -> List[Message]:
+        return list(self._storage.get(session_id, ()))
+
+    async def append_messages(self, session_id: str, messages: List[Message]) -> None:
+        self._storage[session_id].extend(messages)
+
+    async def clear_history(self, session_id: str) -> None:
+        self._storage.pop(session_id, None)
+
+
+class ConcreteStorageProvider(StorageProvider):
+    """Minimal StorageProvider used to exercise the interface."""
+
+    def __init__(self):
+        self._history = ConcreteHistoryStorage()
+        self.initialized = False
+
+    async def initialize(self) -> None:
+        self.initialized = True
+
+    async def close(self) -> None:
+        self.initialized = False
+
+    @property
+    def history(self) -> HistoryStorage:
+        return self._history
+
+
+class TestMessage:
+    """Test cases for the Message dataclass."""
+
+    @pytest.mark.parametrize(
+        "role, content",
+        [
+            ("user", "Hello"),
+            ("assistant", "Hi there!"),
+            ("system", "You are a helpful assistant."),
+            ("user", ""),
+            ("user", LONG_CONTENT),
+        ],
+    )
+    def test_message_valid_roles_and_content(self, role, content):
+        """Test creating messages with each role and varied content."""
+        message = Message(role=role, content=content)
+
+        assert message.role == role
+        assert message.content == content
+        assert isinstance(message.timestamp, datetime)
+
+    def test_message_default_timestamp(self):
+        """Test that the timestamp defaults to the current time."""
+        before = datetime.now()
+        message = Message(role="user", content="Hello")
+        after = datetime.now()
+
+        assert before <= message.timestamp <= after
+
+    def test_message_none_timestamp_is_replaced(self):
+        """Test that an explicit None timestamp is replaced with now."""
+        message = Message(role="user", content="Hello", timestamp=None)
+        assert isinstance(message.timestamp, datetime)
+
+    def test_message_timestamp_serialization_roundtrip(self):
+        """Test that messages survive a to_dict()/from_dict() roundtrip."""
+        message = Message(role="user", content="Hello")
+
+        data = message.to_dict()
+        restored = Message.from_dict(data)
+
+        assert isinstance(data["ts_us"], int)
+        assert restored == message
+
+    def test_message_aware_timestamp_roundtrip(self):
+        """Test that aware timestamps keep their UTC offset."""
+        tz = timezone(timedelta(hours=5, minutes=30))
+        message = Message(
+            role="user", content="Hello",
+            timestamp=datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=tz),
+        )
+
+        restored = Message.from_dict(message.to_dict())
+
+        assert restored == message
+        assert restored.timestamp.utcoffset() == tz.utcoffset(None)
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="time.tzset() is POSIX-only")
+    def test_message_naive_timestamp_ignores_local_timezone(self, monkeypatch):
+        """Test that naive timestamps read back the same under another TZ."""
+        message = Message(
+            role="user", content="Hello", timestamp=datetime(2024, 1, 1, 12, 0, 0)
+        )
+        data = message.to_dict()
+
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            restored = Message.from_dict(data)
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert restored == message
+
+    def test_message_from_dict_shared_timestamp_cache(self):
+        """Test that a timestamp cache gives the same result as no cache."""
+        messages = [
+            Message(role="user", content=str(i),
+                    timestamp=datetime(2024, 1, 1, 12, 0, 0, i * 1000))
+            for i in range(3)
+        ]
+        cache = {}
+
+        restored = [Message.from_dict(m.to_dict(), cache) for m in messages]
+
+        assert restored == messages
+        assert len(cache) == 1
+
+    def test_message_has_no_instance_dict(self):
+        """Test that messages are slotted and keep no per-instance dict."""
+        message = Message(role="user", content="Hello")
+        assert not hasattr(message, "__dict__")
+
+    def test_message_from_dict_interns_role(self):
+        """Test that roles loaded from dicts are interned."""
+        role = "".join(["assis", "tant"])
+        message = Message.from_dict({"role": role, "content": "Hi"})
+
+        assert message.role is sys.intern("assistant")
+
+    def test_message_from_dict_without_timestamp(self):
+        """Test that a missing timestamp falls back to the current time."""
+        message = Message.from_dict({"role": "assistant", "content": "Hi"})
+
+        assert message.role == "assistant"
+        assert message.content == "Hi"
+        assert isinstance(message.timestamp, datetime)
+
+    def test_message_equality(self):
+        """Test that messages with the same fields compare equal."""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        message1 = Message(role="user", content="Hello", timestamp=timestamp)
+        message2 = Message(role="user", content="Hello", timestamp=timestamp)
+
+        assert message1 == message2
+
+
+class TestHistoryStorage:
+    """Test cases for the HistoryStorage interface."""
+
+    def test_history_storage_is_abstract(self):
+        """Test that HistoryStorage cannot be instantiated directly."""
+        with pytest.raises(TypeError):
+            HistoryStorage()
+
+    def test_history_storage_abstract_methods(self):
+        """Test that HistoryStorage declares the expected abstract methods."""
+        assert HistoryStorage.__abstractmethods__ == {
+            "get_history",
+            "append_messages",
+            "clear_history",
+        }
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_concrete_history_storage_implementation(self):
+        """Test a concrete HistoryStorage implementation."""
+        storage = ConcreteHistoryStorage()
+        messages = [
+            Message(role="user", content="Hello"),
+            Message(role="assistant", content="Hi there!"),
+        ]
+
+        await storage.append_messages("session-1", messages)
+        assert await storage.get_history("session-1") == messages
+
+        await storage.clear_history("session-1")
+        assert await storage.get_history("session-1") == []
+
+
+class TestStorageProvider:
+    """Test cases for the StorageProvider interface."""
+
+    def test_storage_provider_is_abstract(self):
+        """Test that StorageProvider cannot be instantiated directly."""
+        with pytest.raises(TypeError):
+            StorageProvider()
+
+    def test_storage_provider_abstract_methods(self):
+        """Test that StorageProvider declares the expected abstract methods."""
+        assert StorageProvider.__abstractmethods__ == {"initialize", "close", "history"}
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_concrete_storage_provider_implementation(self):
+        """Test a concrete StorageProvider implementation."""
+        provider = ConcreteStorageProvider()
+
+        await provider.initialize()
+        assert provider.initialized
+        assert isinstance(provider.history, HistoryStorage)
+
+        await provider.close()
+        assert not provider.initialized
@@ -0,0 +1,494 @@
+"""
+Tests for JSON file storage implementation - Epic 6: Storage Layer.
+"""
+
+import asyncio
+import json
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from chat_shell.storage.json_storage import JSONHistoryStorage, JSONStorage
+from chat_shell.storage.interfaces import Message
+
+
+pytestmark = [pytest.mark.chat_shell, pytest.mark.unit, pytest.mark.epic_6]
+
+
+@pytest.fixture(scope="session")
+def storage_root(tmp_path_factory):
+    """Create one temporary root shared by all JSON storage tests."""
+    return tmp_path_factory.mktemp("json_storage")
+
+
+@pytest.fixture
+def temp_storage_dir(storage_root, request):
+    """Return a per-test storage path under the shared root.
+
+    Test names repeat across classes, so the class name is part of the
+    directory name; mkdir() fails loudly if two tests still collide.
+    """
+    name = request.node.name
+    if request.cls is not None:
+        name = f"{request.cls.__name__}.{name}"
+    test_dir = storage_root / name
+    test_dir.mkdir()
+    return test_dir / "storage"
+
+
+@pytest.fixture
+def json_storage(temp_storage_dir):
+    """Create JSON history storage."""
+    return JSONHistoryStorage(temp_storage_dir)
+
+
+@pytest.mark.asyncio
+class TestJSONHistoryStorage:
+    """Test JSON history storage implementation."""
+
+    async def test_storage_directory_creation(self, temp_storage_dir):
+        """Test that the sessions directory is created on construction."""
+        JSONHistoryStorage(temp_storage_dir)
+        assert (temp_storage_dir / "sessions").is_dir()
+
+    async def test_session_file_path_is_cached(self, json_storage):
+        """Test that session file paths are built once per session."""
+        session_file = json_storage._get_session_file("session-1")
+
+        assert session_file == json_storage.sessions_path / "session-1.jsonl"
+        assert json_storage._get_session_file("session-1") is session_file
+
+    async def test_get_history_empty_session(self, json_storage):
+        """Test getting history for a non-existent session."""
+        assert await json_storage.get_history("non-existent") == []
+        assert not any(json_storage.sessions_path.iterdir())
+
+    async def test_append_and_get_history(self, json_storage, sample_messages):
+        """Test appending and retrieving messages."""
+        await json_storage.append_messages("session-1", sample_messages)
+        history = await json_storage.get_history("session-1")
+
+        assert history == sample_messages
+
+    async def test_append_multiple_times(self, json_storage, sample_messages):
+        """Test that repeated appends accumulate in order."""
+        await json_storage.append_messages("session-1", sample_messages[:1])
+        await json_storage.append_messages("session-1", sample_messages[1:])
+
+        history = await json_storage.get_history("session-1")
+        assert history == sample_messages
+
+    async def test_append_from_generator(self, json_storage, sample_messages):
+        """Test appending messages produced lazily by a generator."""
+        await json_storage.append_messages("session-1", (m for m in sample_messages))
+
+        assert await json_storage.get_history("session-1") == sample_messages
+
+    async def test_generator_consumed_on_event_loop_thread(
+        self, json_storage, sample_messages
+    ):
+        """Test that the caller's generator is not advanced in a worker thread."""
+        threads = set()
+
+        def produce():
+            for message in sample_messages:
+                threads.add(threading.get_ident())
+                yield message
+
+        await json_storage.append_messages("session-1", produce())
+
+        assert threads == {threading.get_ident()}
+        assert await json_storage.get_history("session-1") == sample_messages
+
+    async def test_empty_messages_list(self, json_storage):
+        """Test appending an empty list of messages."""
+        await json_storage.append_messages("session-1", [])
+
+        assert await json_storage.get_history("session-1") == []
+        assert not any(json_storage.sessions_path.iterdir())
+
+    async def test_empty_generator_creates_no_files(self, json_storage):
+        """Test that an exhausted iterable does not lock or create files."""
+        await json_storage.append_messages("session-1", iter(()))
+
+        assert not any(json_storage.sessions_path.iterdir())
+
+    async def test_clear_history(self, json_storage, sample_messages):
+        """Test clearing history for a session."""
+        await json_storage.append_messages("session-1", sample_messages)
+        await json_storage.clear_history("session-1")
+
+        assert await json_storage.get_history("session-1") == []
+
+    async def test_clear_history_removes_lock_file(self, json_storage, sample_messages):
+        """Test that clearing a session leaves no files behind."""
+        await json_storage.append_messages("session-1", sample_messages)
+        await json_storage.clear_history("session-1")
+
+        assert not any(json_storage.sessions_path.iterdir())
+
+    async def test_append_after_clear(self, json_storage, sample_messages):
+        """Test that a cleared session can be written again."""
+        await json_storage.append_messages("session-1", sample_messages)
+        await json_storage.clear_history("session-1")
+        await json_storage.append_messages("session-1", sample_messages[:1])
+
+        assert await json_storage.get_history("session-1") == sample_messages[:1]
+
+    async def test_clear_nonexistent_session(self, json_storage):
+        """Test that clearing an unknown session is a no-op."""
+        await json_storage.clear_history("non-existent")
+
+    async def test_large_number_of_messages(self, json_storage):
+        """Test storing and loading a large session."""
+        messages = [
+            Message(role="user" if i % 2 == 0 else "assistant", content=f"Message {i}")
+            for i in range(100)
+        ]
+
+        await json_storage.append_messages("large-session", messages)
+        history = await json_storage.get_history("large-session")
+
+        assert history == messages
+
+    async def test_unicode_content(self, json_storage):
+        """Test that non-ASCII content roundtrips."""
+        messages = [Message(role="user", content="你好, мир! 🎉")]
+
+        await json_storage.append_messages("unicode", messages)
+        history = await json_storage.get_history("unicode")
+
+        assert history[0].content == "你好, мир! 🎉"
+
+    async def test_json_serialization_format(self, json_storage, sample_messages):
+        """Test the on-disk NDJSON session file format."""
+        await json_storage.append_messages("session-1", sample_messages)
+
+        session_file = json_storage._get_session_file("session-1")
+        lines = session_file.read_bytes().splitlines()
+
+        assert session_file.suffix == ".jsonl"
+        assert len(lines) == 3
+        assert json.loads(lines[1]) == sample_messages[1].to_dict()
+        assert json.loads(lines[1])["content"] == "Hello"
+
+    async def test_append_does_not_rewrite_history(self, json_storage, sample_messages):
+        """Test that appending leaves previously written bytes untouched."""
+        await json_storage.append_messages("session-1", sample_messages[:1])
+        session_file = json_storage._get_session_file("session-1")
+        before = session_file.read_bytes()
+
+        await json_storage.append_messages("session-1", sample_messages[1:])
+
+        assert session_file.read_bytes().startswith(before)
+
+    async def test_corrupt_json_file_handling(self, json_storage):
+        """Test that a corrupt session file yields an empty history."""
+        json_storage._get_session_file("corrupt").write_text("{not valid json")
+
+        assert await json_storage.get_history("corrupt") == []
+
+    async def test_corrupt_line_is_skipped(self, json_storage, sample_messages):
+        """Test that a damaged line does not hide the valid ones."""
+        await json_storage.append_messages("session-1", sample_messages[:1])
+        with json_storage._get_session_file("session-1").open("a") as f:
+            f.write('{"role": "user", "cont\n')
+        await json_storage.append_messages("session-1", sample_messages[1:])
+
+        assert await json_storage.get_history("session-1") == sample_messages
+
+    @pytest.mark.parametrize(
+        "record",
+        [
+            {"role": "user", "content": "x", "ts_us": 10**30},
+            {"role": "user", "content": "x", "ts_us": 0, "tz": 10**6},
+        ],
+        ids=["ts_us-overflow", "tz-out-of-range"],
+    )
+    async def test_out_of_range_line_is_skipped(
+        self, json_storage, sample_messages, record
+    ):
+        """Test that valid JSON with unusable field values is skipped."""
+        await json_storage.append_messages("session-1", sample_messages[:1])
+        with json_storage._get_session_file("session-1").open("a") as f:
+            f.write(json.dumps(record) + "\n")
+        await json_storage.append_messages("session-1", sample_messages[1:])
+
+        assert await json_storage.get_history("session-1") == sample_messages
+
+    async def test_missing_timestamp_handling(self, json_storage):
+        """Test that messages without a timestamp get one on load."""
+        json_storage._get_session_file("no-ts").write_text(
+            json.dumps({"role": "user", "content": "Hello"}) + "\n"
+        )
+
+        history = await json_storage.get_history("no-ts")
+
+        assert len(history) == 1
+        assert history[0].content == "Hello"
+        assert isinstance(history[0].timestamp, datetime)
+
+    async def test_legacy_session_file_migration(self, json_storage, sample_messages):
+        """Test that single-document session files are converted on access."""
+        legacy_file = json_storage._get_legacy_session_file("legacy")
+        legacy_file.write_text(json.dumps({
+            "session_id": "legacy",
+            "updated_at": "2024-01-01T12:00:03",
+            "messages": [
+                {
+                    "role": msg.role,
+                    "content": msg.content,
+                    "timestamp": msg.timestamp.isoformat(),
+                }
+                for msg in sample_messages[:2]
+            ],
+        }))
+
+        await json_storage.append_messages("legacy", sample_messages[2:])
+
+        assert not legacy_file.exists()
+        assert not list(json_storage.sessions_path.glob("*.tmp"))
+        assert await json_storage.get_history("legacy") == sample_messages
+
+    async def test_clear_legacy_session(self, json_storage):
+        """Test that clearing removes a not yet migrated session file."""
+        legacy_file = json_storage._get_legacy_session_file("legacy")
+        legacy_file.write_text(json.dumps({"messages": []}))
+
+        await json_storage.clear_history("legacy")
+
+        assert not legacy_file.exists()
+
+    async def test_write_permission_error_handling(self, json_storage, sample_messages):
+        """Test that write errors are reported rather than raised."""
+        with patch("pathlib.Path.open", side_effect=PermissionError("denied")):
+            await json_storage.append_messages("session-1", sample_messages)
+
+        assert await json_storage.get_history("session-1") == []
+
+    async def test_multiple_sessions_isolation(self, json_storage, sample_messages):
+        """Test that sessions are isolated from each other."""
+        await json_storage.append_messages("session-1", sample_messages[:1])
+        await json_storage.append_messages("session-2", sample_messages[1:])
+
+        assert await json_storage.get_history("session-1") == sample_messages[:1]
+        assert await json_storage.get_history("session-2") == sample_messages[1:]
+
+    async def test_multiple_instances_isolation(
+        self, temp_storage_dir, sample_messages
+    ):
+        """Test that instances on different paths do not share sessions."""
+        storage1 = JSONHistoryStorage(temp_storage_dir / "one")
+        storage2 = JSONHistoryStorage(temp_storage_dir / "two")
+
+        await storage1.append_messages("session-1", sample_messages)
+
+        assert await storage1.get_history("session-1") == sample_messages
+        assert await storage2.get_history("session-1") == []
+
+    async def test_shared_path_visibility(self, temp_storage_dir, sample_messages):
+        """Test that instances on the same path see each other's writes."""
+        storage1 = JSONHistoryStorage(temp_storage_dir)
+        storage2 = JSONHistoryStorage(temp_storage_dir)
+
+        await storage1.append_messages("session-1", sample_messages)
+
+        assert await storage2.get_history("session-1") == sample_messages
+
+    async def test_concurrent_session_operations(self, json_storage):
+        """Test sequential operations across many sessions."""
+        for i in range(10):
+            await json_storage.append_messages(
+                f"session-{i}", [Message(role="user", content=f"Message {i}")]
+            )
+
+        for i in range(10):
+            history = await json_storage.get_history(f"session-{i}")
+            assert [m.content for m in history] == [f"Message {i}"]
+
+    async def test_concurrent_session_writes(self, json_storage):
+        """Test gathered appends and reads across many sessions."""
+        session_ids = [f"session-{i}" for i in range(50)]
+
+        await asyncio.gather(*(
+            json_storage.append_messages(sid, [Message(role="user", content=sid)])
+            for sid in session_ids
+        ))
+        histories = await asyncio.gather(*(
+            json_storage.get_history(sid) for sid in session_ids
+        ))
+
+        for sid, history in zip(session_ids, histories):
+            assert [m.content for m in history] == [sid]
+
+    async def test_concurrent_appends_same_session(self, json_storage):
+        """Test that concurrent appends to one session keep every line intact."""
+        batches = [
+            [Message(role="user", content=f"batch {b} message {i}") for i in range(5)]
+            for b in range(20)
+        ]
+
+        await asyncio.gather(*(
+            json_storage.append_messages("shared", batch) for batch in batches
+        ))
+        history = await json_storage.get_history("shared")
+
+        assert len(history) == 100
+        assert {m.content for m in history} == {
+            m.content for batch in batches for m in batch
+        }
+
+
+@pytest.fixture
+def zstd_storage(temp_storage_dir):
+    """Create zstd-compressed JSON history storage."""
+    pytest.importorskip("zstandard")
+    return JSONHistoryStorage(temp_storage_dir, compression="zstd")
+
+
+@pytest.mark.asyncio
+class TestJSONHistoryStorageCompression:
+    """Test zstd-compressed JSON history storage."""
+
+    async def test_unsupported_compression(self, temp_storage_dir):
+        """Test that unknown codecs are rejected."""
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            JSONHistoryStorage(temp_storage_dir, compression="gzip")
+
+    async def test_compressed_file_format(self, zstd_storage, sample_messages):
+        """Test that sessions are written as zstd-compressed NDJSON."""
+        import zstandard
+
+        await zstd_storage.append_messages("session-1", sample_messages)
+
+        session_file = zstd_storage._get_session_file("session-1")
+        lines = zstandard.decompress(session_file.read_bytes()).splitlines()
+
+        assert session_file.name == "session-1.jsonl.zst"
+        assert json.loads(lines[1]) == sample_messages[1].to_dict()
+
+    async def test_append_multiple_times(self, zstd_storage, sample_messages):
+        """Test that one frame per append is read back in order."""
+        for message in sample_messages:
+            await zstd_storage.append_messages("session-1", [message])
+
+        assert await zstd_storage.get_history("session-1") == sample_messages
+
+    async def test_corrupt_file_handling(self, zstd_storage):
+        """Test that an undecodable file yields an empty history."""
+        zstd_storage._get_session_file("corrupt").write_bytes(b"not zstd")
+
+        assert await zstd_storage.get_history("corrupt") == []
+
+    async def test_legacy_session_file_migration(self, zstd_storage, sample_messages):
+        """Test that single-document session files are converted compressed."""
+        legacy_file = zstd_storage._get_legacy_session_file("legacy")
+        legacy_file.write_text(json.dumps({
+            "messages": [
+                {
+                    "role": msg.role,
+                    "content": msg.content,
+                    "timestamp": msg.timestamp.isoformat(),
+                }
+                for msg in sample_messages
+            ],
+        }))
+
+        assert await zstd_storage.get_history("legacy") == sample_messages
+        assert not legacy_file.exists()
+
+    async def test_truncated_frame_keeps_other_appends(
+        self, zstd_storage, sample_messages
+    ):
+        """Test that a frame cut short mid-append only loses its own messages."""
+        for message in sample_messages[:2]:
+            await zstd_storage.append_messages("session-1", [message])
+        session_file = zstd_storage._get_session_file("session-1")
+        session_file.write_bytes(session_file.read_bytes()[:-5])
+
+        await zstd_storage.append_messages("session-1", sample_messages[2:])
+
+        history = await zstd_storage.get_history("session-1")
+        assert history == [sample_messages[0], sample_messages[2]]
+
+    async def test_truncated_final_frame_keeps_earlier_appends(
+        self, zstd_storage, sample_messages
+    ):
+        """Test that a damaged last frame does not hide earlier frames."""
+        for message in sample_messages:
+            await zstd_storage.append_messages("session-1", [message])
+        session_file = zstd_storage._get_session_file("session-1")
+        session_file.write_bytes(session_file.read_bytes()[:-5])
+
+        history = await zstd_storage.get_history("session-1")
+        assert history == sample_messages[:2]
+
+    async def test_plain_session_converted_when_enabled(
+        self, temp_storage_dir, sample_messages
+    ):
+        """Test that enabling compression keeps existing plain sessions."""
+        storage = JSONHistoryStorage(temp_storage_dir)
+        await storage.append_messages("session-1", sample_messages)
+        zstd_storage = JSONHistoryStorage(temp_storage_dir, compression="zstd")
+
+        assert await zstd_storage.get_history("session-1") == sample_messages
+        assert not storage._get_session_file("session-1").exists()
+
+    async def test_compressed_session_converted_when_disabled(
+        self, zstd_storage, temp_storage_dir, sample_messages
+    ):
+        """Test that disabling compression keeps existing compressed sessions."""
+        await zstd_storage.append_messages("session-1", sample_messages[:2])
+        storage = JSONHistoryStorage(temp_storage_dir)
+
+        await storage.append_messages("session-1", sample_messages[2:])
+
+        assert await storage.get_history("session-1") == sample_messages
+        assert not zstd_storage._get_session_file("session-1").exists()
+
+    async def test_clear_removes_both_formats(self, zstd_storage, temp_storage_dir):
+        """Test that clearing a session removes plain and compressed files."""
+        plain_file = JSONHistoryStorage(temp_storage_dir)._get_session_file("s")
+        plain_file.write_bytes(b"")
+        zstd_storage._get_session_file("s").write_bytes(b"")
+
+        await zstd_storage.clear_history("s")
+
+        assert not any(zstd_storage.sessions_path.iterdir())
+
+    async def test_provider_passes_compression(self, temp_storage_dir):
+        """Test that JSONStorage forwards the codec to its history storage."""
+        pytest.importorskip("zstandard")
+        storage = JSONStorage(temp_storage_dir, compression="zstd")
+        await storage.initialize()
+
+        assert storage.history.compression == "zstd"
+
+
+@pytest.mark.asyncio
+class TestJSONStorage:
+    """Test JSON storage provider implementation."""
+
+    async def test_history_property_after_initialize(self, temp_storage_dir):
+        """Test that history is available after initialize."""
+        storage = JSONStorage(temp_storage_dir)
+        await storage.initialize()
+
+        assert isinstance(storage.history, JSONHistoryStorage)
+        await storage.close()
+
+    async def test_history_property_before_initialize(self, temp_storage_dir):
+        """Test that accessing history before initialize raises error."""
+        storage = JSONStorage(temp_storage_dir)
+
+        with pytest.raises(RuntimeError, match="not initialized"):
+            _ = storage.history
+
+    async def test_initialize_creates_storage_path(self, temp_storage_dir):
+        """Test that initialize creates the storage directory."""
+        storage = JSONStorage(temp_storage_dir)
+        await storage.initialize()
+
+        assert temp_storage_dir.is_dir()
@@ -0,0 +1,126 @@
+"""
+Tests for in-memory storage implementation - Epic 6: Storage Layer.
+"""
+
+import pytest
+
+from chat_shell.storage.memory_storage import MemoryHistoryStorage, MemoryStorage
+from chat_shell.storage.interfaces import Message
+
+
+pytestmark = [pytest.mark.chat_shell, pytest.mark.unit, pytest.mark.epic_6]
+
+
+@pytest.fixture
+def memory_storage():
+    """Create in-memory history storage."""
+    return MemoryHistoryStorage()
+
+
+@pytest.mark.asyncio
+class TestMemoryHistoryStorage:
+    """Test in-memory history storage implementation."""
+
+    async def test_get_history_empty_session(self, memory_storage):
+        """Test getting history for a non-existent session."""
+        assert await memory_storage.get_history("non-existent") == []
+
+    async def test_append_and_get_history(self, memory_storage, sample_messages):
+        """Test appending and retrieving messages."""
+        await memory_storage.append_messages("session-1", sample_messages)
+        history = await memory_storage.get_history("session-1")
+
+        assert history == sample_messages
+
+    async def test_append_multiple_times(self, memory_storage, sample_messages):
+        """Test that repeated appends accumulate in order."""
+        await memory_storage.append_messages("session-1", sample_messages[:1])
+        await memory_storage.append_messages("session-1", sample_messages[1:])
+
+        assert await memory_storage.get_history("session-1") == sample_messages
+
+    async def test_append_from_generator(self, memory_storage, sample_messages):
+        """Test appending messages produced lazily by a generator."""
+        await memory_storage.append_messages("session-1", (m for m in sample_messages))
+
+        assert await memory_storage.get_history("session-1") == sample_messages
+
+    async def test_empty_messages_list(self, memory_storage):
+        """Test appending an empty list of messages."""
+        await memory_storage.append_messages("session-1", [])
+
+        assert await memory_storage.get_history("session-1") == []
+        assert "session-1" not in memory_storage.sessions
+
+    async def test_empty_generator_creates_no_session(self, memory_storage):
+        """Test that an exhausted iterable does not create a session entry."""
+        await memory_storage.append_messages("session-1", iter(()))
+
+        assert "session-1" not in memory_storage.sessions
+
+    async def test_large_number_of_messages(self, memory_storage):
+        """Test storing a large session."""
+        messages = [
+            Message(role="user" if i % 2 == 0 else "assistant", content=f"Message {i}")
+            for i in range(1000)
+        ]
+
+        await memory_storage.append_messages("large-session", messages)
+
+        assert await memory_storage.get_history("large-session") == messages
+
+    async def test_message_immutability(self, memory_storage, sample_messages):
+        """Test that mutating a returned history does not affect storage."""
+        await memory_storage.append_messages("session-1", sample_messages)
+
+        history = await memory_storage.get_history("session-1")
+        history.append(Message(role="user", content="Injected"))
+        sample_messages.clear()
+
+        assert len(await memory_storage.get_history("session-1")) == 3
+
+    async def test_clear_history(self, memory_storage, sample_messages):
+        """Test clearing history for a session."""
+        await memory_storage.append_messages("session-1", sample_messages)
+        await memory_storage.clear_history("session-1")
+
+        assert await memory_storage.get_history("session-1") == []
+
+    async def test_clear_nonexistent_session(self, memory_storage):
+        """Test that clearing an unknown session is a no-op."""
+        await memory_storage.clear_history("non-existent")
+
+    async def test_has_no_instance_dict(self, memory_storage):
+        """Test that the storage is slotted and keeps no per-instance dict."""
+        assert not hasattr(memory_storage, "__dict__")
+
+    async def test_multiple_sessions_isolation(self, memory_storage, sample_messages):
+        """Test that sessions are isolated from each other."""
+        await memory_storage.append_messages("session-1", sample_messages[:1])
+        await memory_storage.append_messages("session-2", sample_messages[1:])
+
+        assert await memory_storage.get_history("session-1") == sample_messages[:1]
+        assert await memory_storage.get_history("session-2") == sample_messages[1:]
+
+
+@pytest.mark.asyncio
+class TestMemoryStorage:
+    """Test in-memory storage provider implementation."""
+
+    async def test_history_available_without_initialize(self):
+        """Test that history is usable right after construction."""
+        storage = MemoryStorage()
+        assert isinstance(storage.history, MemoryHistoryStorage)
+
+    async def test_multiple_instances_isolation(self, sample_messages):
+        """Test that separate providers do not share sessions."""
+        storage1 = MemoryStorage()
+        storage2 = MemoryStorage()
+        await storage1.initialize()
+        await storage2.initialize()
+
+        await storage1.history.append_messages("session-1", sample_messages)
+
+        assert await storage2.history.get_history("session-1") == []
+        await storage1.close()
+        await storage2.close()
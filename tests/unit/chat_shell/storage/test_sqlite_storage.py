@@ -3,8 +3,6 @@ Tests for SQLite storage implementation.
 """
 
 import asyncio
-import tempfile
-from pathlib import Path
 
 import pytest
 
@@ -13,10 +11,9 @@ from chat_shell.storage.interfaces import Message
 
 
 @pytest.fixture
-async def temp_db_path():
+def temp_db_path(tmp_path):
     """Create a temporary database path."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir) / "test.db"
+    return tmp_path / "test.db"
 
 
 @pytest.fixture
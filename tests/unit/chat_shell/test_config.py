@@ -0,0 +1,72 @@
+"""
+Tests for Chat Shell configuration.
+"""
+
+import pytest
+from chat_shell.config import Config, OpenAIConfig, StorageConfig
+
+
+pytestmark = [pytest.mark.chat_shell, pytest.mark.unit]
+
+
+class TestConfig:
+    """Test cases for Config."""
+
+    def test_config_fields(self):
+        """Test that Config exposes the top-level configuration sections."""
+        assert {"openai", "storage", "show_thinking"} <= Config.model_fields.keys()
+
+    @pytest.mark.parametrize(
+        "api_key, expected",
+        [
+            ("sk-valid-key-123", True),
+            ("sk-", True),
+            ("invalid-prefix-123", False),
+            ("SK-upper-case", False),
+            ("", False),
+        ],
+    )
+    def test_validate_api_key(self, api_key, expected):
+        """Test API key validation against the 'sk-' prefix."""
+        config = Config(openai=OpenAIConfig(api_key=api_key))
+        assert config.validate_api_key() is expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("true", True),
+            ("TRUE", True),
+            ("True", True),
+            ("false", False),
+            ("1", False),
+            ("0", False),
+            ("yes", False),
+            ("no", False),
+            ("anything", False),
+            ("", False),
+        ],
+    )
+    def test_show_thinking_environment_variable(self, monkeypatch, value, expected):
+        """Test that only 'true' (any case) enables show_thinking."""
+        monkeypatch.setenv("CHAT_SHELL_SHOW_THINKING", value)
+        assert Config().show_thinking is expected
+
+    def test_show_thinking_default(self, monkeypatch):
+        """Test that show_thinking is off when the variable is unset."""
+        monkeypatch.delenv("CHAT_SHELL_SHOW_THINKING", raising=False)
+        assert Config().show_thinking is False
+
+    def test_get_storage_path_creation(self, tmp_path):
+        """Test that get_storage_path creates a missing directory."""
+        storage_path = tmp_path / "nested" / "storage"
+        config = Config(storage=StorageConfig(path=storage_path))
+
+        assert config.get_storage_path() == storage_path
+        assert storage_path.is_dir()
+
+    def test_get_storage_path_existing(self, tmp_path):
+        """Test that get_storage_path accepts an existing directory."""
+        config = Config(storage=StorageConfig(path=tmp_path))
+
+        assert config.get_storage_path() == tmp_path
+        assert tmp_path.is_dir()
@@ -1,15 +1,244 @@
 """
-Tests for PromptModifierTool protocol - Epic 1: Core Agent System.
+Tests for tool base classes - Epic 3: Tools System, and the
+PromptModifierTool protocol - Epic 1: Core Agent System.
 """
 
+import json
+from typing import List, Optional
+
 import pytest
-from chat_shell.tools.base import PromptModifierTool
+from pydantic import BaseModel, Field, ValidationError
+
+from chat_shell.tools.base import BaseTool, PromptModifierTool, ToolInput, ToolOutput
 from chat_shell.agent.agent import AgentState
 
 
-pytestmark = [pytest.mark.chat_shell, pytest.mark.unit, pytest.mark.epic_1]
+pytestmark = [pytest.mark.chat_shell, pytest.mark.unit]
+
+
+# Tool and schema subclasses are declared once here rather than inside each
+# test, so their pydantic schemas are built once per module import.
+
+
+class ExtendedToolInput(ToolInput):
+    """Tool input with a required and an optional field."""
+    query: str
+    limit: int = 10
+
+
+class ValidatedToolInput(ToolInput):
+    """Tool input with a constrained field."""
+    count: int = Field(..., gt=0, description="Number of items")
+
+
+class ComplexToolInput(ToolInput):
+    """Tool input with nested and optional fields."""
+    tags: List[str]
+    metadata: Optional[dict] = None
+    threshold: float = Field(0.5, ge=0.0, le=1.0)
+
+
+class ConcreteTool(BaseTool):
+    """Minimal tool that echoes its query."""
+
+    name = "concrete"
+    description = "A concrete test tool"
+    input_schema = ExtendedToolInput
+
+    async def execute(self, input_data: ExtendedToolInput) -> ToolOutput:
+        return ToolOutput(result=input_data.query[: input_data.limit])
+
+
+class ErrorTool(BaseTool):
+    """Tool that reports failures through its output."""
+
+    name = "error"
+    description = "Always fails"
+
+    async def execute(self, input_data: ToolInput) -> ToolOutput:
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError as e:
+            return ToolOutput(result="", error=str(e))
+
+
+class ParentTool(ConcreteTool):
+    """Tool whose attributes are inherited."""
+
+    name = "parent"
+
+
+class ChildTool(ParentTool):
+    """Tool that overrides only its description."""
+
+    description = "A child test tool"
+
+
+class ComplexTool(BaseTool):
+    """Tool with a nested input schema."""
+
+    name = "complex"
+    description = "Counts tags above a threshold"
+    input_schema = ComplexToolInput
+
+    async def execute(self, input_data: ComplexToolInput) -> ToolOutput:
+        return ToolOutput(result={
+            "tags": len(input_data.tags),
+            "threshold": input_data.threshold,
+        })
+
+
+@pytest.mark.epic_3
+class TestToolInput:
+    """Test cases for ToolInput."""
+
+    @pytest.mark.structural
+    def test_tool_input_is_pydantic_model(self):
+        """Test that ToolInput is a pydantic model."""
+        assert issubclass(ToolInput, BaseModel)
+
+    def test_tool_input_extension(self):
+        """Test that subclasses add their own fields."""
+        input_data = ExtendedToolInput(query="hello")
+
+        assert input_data.query == "hello"
+        assert input_data.limit == 10
+
+    def test_tool_input_validation(self):
+        """Test that field constraints are enforced."""
+        assert ValidatedToolInput(count=3).count == 3
+
+        with pytest.raises(ValidationError, match="greater than 0"):
+            ValidatedToolInput(count=0)
+
+    def test_tool_input_serialization(self):
+        """Test that inputs serialize to JSON."""
+        input_data = ExtendedToolInput(query="hello", limit=3)
+
+        assert json.loads(input_data.model_dump_json()) == {
+            "query": "hello",
+            "limit": 3,
+        }
+
+
+@pytest.mark.epic_3
+class TestToolOutput:
+    """Test cases for ToolOutput."""
+
+    @pytest.mark.structural
+    def test_tool_output_is_pydantic_model(self):
+        """Test that ToolOutput is a pydantic model."""
+        assert issubclass(ToolOutput, BaseModel)
+
+    def test_tool_output_default_error(self):
+        """Test that the error defaults to an empty string."""
+        output = ToolOutput(result="ok")
+
+        assert output.result == "ok"
+        assert output.error == ""
+
+    def test_tool_output_with_error(self):
+        """Test creating an output that carries an error."""
+        output = ToolOutput(result="", error="failed")
+
+        assert output.error == "failed"
+
+    @pytest.mark.parametrize("result", [42, ["a", "b"], {"key": "value"}, None])
+    def test_tool_output_any_result(self, result):
+        """Test that results of any type are accepted unchanged."""
+        assert ToolOutput(result=result).result == result
+
+    def test_tool_output_serialization(self):
+        """Test that outputs serialize to JSON."""
+        output = ToolOutput(result={"count": 2}, error="")
+
+        assert json.loads(output.model_dump_json()) == {
+            "result": {"count": 2},
+            "error": "",
+        }
+
+    @pytest.mark.structural
+    def test_tool_output_representation(self):
+        """Test that the repr shows the result."""
+        assert "done" in repr(ToolOutput(result="done"))
+
+    @pytest.mark.structural
+    def test_tool_output_equality(self):
+        """Test that outputs with the same fields compare equal."""
+        assert ToolOutput(result="x") == ToolOutput(result="x")
+        assert ToolOutput(result="x") != ToolOutput(result="x", error="e")
+
+
+@pytest.mark.epic_3
+class TestBaseTool:
+    """Test cases for BaseTool."""
+
+    def test_base_tool_is_abstract(self):
+        """Test that BaseTool cannot be instantiated directly."""
+        with pytest.raises(TypeError):
+            BaseTool()
+
+    def test_base_tool_defaults(self):
+        """Test the class-level defaults."""
+        assert BaseTool.name == ""
+        assert BaseTool.description == ""
+        assert BaseTool.input_schema is ToolInput
+
+    def test_concrete_tool_attributes(self):
+        """Test that subclasses set their own attributes."""
+        tool = ConcreteTool()
+
+        assert tool.name == "concrete"
+        assert tool.description == "A concrete test tool"
+        assert tool.input_schema is ExtendedToolInput
+
+    def test_to_dict(self):
+        """Test conversion to a LangChain tool dictionary."""
+        assert ConcreteTool().to_dict() == {
+            "name": "concrete",
+            "description": "A concrete test tool",
+            "args_schema": ExtendedToolInput,
+        }
+
+    @pytest.mark.asyncio
+    async def test_execute(self):
+        """Test executing a concrete tool."""
+        result = await ConcreteTool().execute(
+            ExtendedToolInput(query="hello world", limit=5)
+        )
+
+        assert result == ToolOutput(result="hello")
+
+    @pytest.mark.asyncio
+    async def test_execute_error(self):
+        """Test that a tool can report errors through its output."""
+        result = await ErrorTool().execute(ToolInput())
+
+        assert result.result == ""
+        assert result.error == "boom"
+
+    def test_tool_inheritance(self):
+        """Test that tool attributes are inherited and overridable."""
+        tool = ChildTool()
+
+        assert tool.name == "parent"
+        assert tool.description == "A child test tool"
+        assert tool.input_schema is ExtendedToolInput
+
+    @pytest.mark.asyncio
+    async def test_tool_with_complex_input_schema(self):
+        """Test a tool whose input has nested and optional fields."""
+        input_data = ComplexToolInput(tags=["a", "b"], threshold=0.8)
+        result = await ComplexTool().execute(input_data)
+
+        assert result.result == {"tags": 2, "threshold": 0.8}
+        assert input_data.metadata is None
+
+        with pytest.raises(ValidationError, match="less than or equal to 1"):
+            ComplexToolInput(tags=["a"], threshold=1.5)
 
 
+@pytest.mark.epic_1
 class TestPromptModifierTool:
     """Test cases for PromptModifierTool protocol."""
 
@@ -0,0 +1,188 @@
+"""
+Tests for CalculatorTool - Epic 3: Tools System.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from chat_shell.tools.base import ToolOutput
+from chat_shell.tools.calculator import CalculatorInput, CalculatorTool
+
+
+pytestmark = [pytest.mark.chat_shell, pytest.mark.unit, pytest.mark.epic_3]
+
+BASIC_ARITHMETIC_CASES = [
+    ("2 + 3", "5"),
+    ("10 - 4", "6"),
+    ("6 * 7", "42"),
+    ("15 / 3", "5.0"),
+    ("17 // 5", "3"),
+    ("17 % 5", "2"),
+    ("2 ** 10", "1024"),
+    # Integer results are not truncated
+    ("999999999 * 999999999", "999999998000000001"),
+    # Float results are returned at full precision
+    ("0.1 + 0.2", "0.30000000000000004"),
+]
+
+COMPLEX_EXPRESSION_CASES = [
+    ("(2 + 3) * 4", "20"),
+    ("2 + 3 * 4", "14"),
+    ("((1 + 2) * (3 + 4)) // 2", "10"),
+    ("2 ** 3 ** 2", "512"),
+    ("100 / (5 * 4) - 1", "4.0"),
+]
+
+ERROR_CASES = [
+    ("1 / 0", "division by zero"),
+    ("2 +", "Invalid expression"),
+    ("x + 1", "Unsupported node type"),
+    ("", "Invalid expression"),
+]
+
+DANGEROUS_EXPRESSIONS = (
+    "__import__('os').system('ls')",
+    "open('/etc/passwd').read()",
+    "eval('1 + 1')",
+    "exec('x = 1')",
+    "().__class__.__bases__",
+    "[1, 2, 3]",
+    "lambda: 1",
+    "globals()",
+)
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    """Create one calculator shared by the module; execute() is stateless."""
+    return CalculatorTool()
+
+
+class TestCalculatorTool:
+    """Test cases for CalculatorTool."""
+
+    def test_tool_attributes(self, calculator):
+        """Test tool has correct attributes."""
+        assert calculator.name == "calculator"
+        assert "arithmetic" in calculator.description
+        assert calculator.input_schema is CalculatorInput
+
+    def test_to_dict(self, calculator):
+        """Test conversion to a LangChain tool dictionary."""
+        assert calculator.to_dict() == {
+            "name": "calculator",
+            "description": calculator.description,
+            "args_schema": CalculatorInput,
+        }
+
+    def test_input_requires_expression(self):
+        """Test that the input schema rejects a missing expression."""
+        with pytest.raises(ValidationError, match="expression"):
+            CalculatorInput()
+
+    @pytest.mark.asyncio(loop_scope="class")
+    @pytest.mark.parametrize(
+        "expression, expected",
+        BASIC_ARITHMETIC_CASES,
+        ids=[expression for expression, _ in BASIC_ARITHMETIC_CASES],
+    )
+    async def test_basic_arithmetic(self, calculator, expression, expected):
+        """Test each supported binary operator."""
+        input_data = CalculatorInput.model_construct(expression=expression)
+        result = await calculator.execute(input_data)
+
+        assert isinstance(result, ToolOutput)
+        assert result.result == expected
+        assert result.error == ""
+
+    @pytest.mark.asyncio(loop_scope="class")
+    @pytest.mark.parametrize(
+        "expression, expected",
+        COMPLEX_EXPRESSION_CASES,
+        ids=[expression for expression, _ in COMPLEX_EXPRESSION_CASES],
+    )
+    async def test_complex_expressions(self, calculator, expression, expected):
+        """Test operator precedence and parentheses."""
+        input_data = CalculatorInput.model_construct(expression=expression)
+        result = await calculator.execute(input_data)
+
+        assert result.result == expected
+
+    @pytest.mark.asyncio(loop_scope="class")
+    @pytest.mark.parametrize(
+        "expression, expected_error_contains",
+        ERROR_CASES,
+        ids=[f"{expression!r}->{error}" for expression, error in ERROR_CASES],
+    )
+    async def test_error_handling(
+        self, calculator, expression, expected_error_contains
+    ):
+        """Test that invalid expressions are reported in the output."""
+        input_data = CalculatorInput.model_construct(expression=expression)
+        result = await calculator.execute(input_data)
+
+        assert result.result == ""
+        # Plain substring check: errors are returned, not raised, and the
+        # expected fragments are literals, so no regex matching is needed
+        assert expected_error_contains in result.error
+
+    @pytest.mark.asyncio(loop_scope="class")
+    @pytest.mark.parametrize("expression", DANGEROUS_EXPRESSIONS)
+    async def test_safe_eval_security(self, calculator, expression):
+        """Test that anything beyond arithmetic is rejected."""
+        input_data = CalculatorInput.model_construct(expression=expression)
+        result = await calculator.execute(input_data)
+
+        assert result.result == ""
+        assert "Invalid expression" in result.error
+
+    @pytest.mark.asyncio(loop_scope="class")
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            ("-5", "-5"),
+            ("+5", "5"),
+            ("--5", "5"),
+            ("-(2 + 3)", "-5"),
+        ],
+    )
+    async def test_unary_operators(self, calculator, expression, expected):
+        """Test unary plus and minus."""
+        input_data = CalculatorInput.model_construct(expression=expression)
+        result = await calculator.execute(input_data)
+
+        assert result.result == expected
+
+    @pytest.mark.asyncio(loop_scope="class")
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            ("2+3", "5"),
+            ("  2 + 3  ", "5"),
+            ("\t2\t+\t3", "5"),
+            ("2\n+\n3", "5"),
+        ],
+    )
+    async def test_whitespace_handling(self, calculator, expression, expected):
+        """Test that surrounding and embedded whitespace is ignored."""
+        input_data = CalculatorInput.model_construct(expression=expression)
+        result = await calculator.execute(input_data)
+
+        assert result.result == expected
+
+    @pytest.mark.asyncio(loop_scope="class")
+    @pytest.mark.parametrize(
+        "expression, expected",
+        [
+            ("2 + 3.5", "5.5"),
+            ("10 / 4", "2.5"),
+            ("2.5 * 2", "5.0"),
+            ("7.5 // 2", "3.0"),
+        ],
+    )
+    async def test_mixed_number_types(self, calculator, expression, expected):
+        """Test arithmetic mixing integers and floats."""
+        input_data = CalculatorInput.model_construct(expression=expression)
+        result = await calculator.execute(input_data)
+
+        assert result.result == expected
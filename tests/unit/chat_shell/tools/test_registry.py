@@ -0,0 +1,396 @@
+"""
+Tests for ToolRegistry - Epic 3: Tools System.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.tools import BaseTool as LangChainBaseTool
+from pydantic import Field
+
+from chat_shell.tools.base import BaseTool, ToolInput, ToolOutput
+from chat_shell.tools.calculator import CalculatorTool
+from chat_shell.tools.exceptions import ToolNotFoundError, ToolRegistrationError
+from chat_shell.tools.registry import (
+    ToolRegistry,
+    get_tool_registry,
+    set_tool_registry,
+    tool_registry,
+)
+
+
+pytestmark = [pytest.mark.chat_shell, pytest.mark.unit, pytest.mark.epic_3]
+
+
+class MockToolInput(ToolInput):
+    """Input for MockTool."""
+    text: str = Field(..., description="Text to echo")
+
+
+class MockTool(BaseTool):
+    """Tool that echoes its input."""
+
+    name = "mock_tool"
+    description = "Echo the given text"
+    input_schema = MockToolInput
+
+    async def execute(self, input_data: MockToolInput) -> ToolOutput:
+        return ToolOutput(result=f"echo: {input_data.text}")
+
+
+class ErrorToolInput(ToolInput):
+    """Input for ErrorTool."""
+    param: str = Field(..., description="Ignored")
+
+
+class ErrorTool(BaseTool):
+    """Tool that always reports an error."""
+
+    name = "error_tool"
+    description = "Always fails"
+    input_schema = ErrorToolInput
+
+    async def execute(self, input_data: ErrorToolInput) -> ToolOutput:
+        return ToolOutput(result="", error="Test error message")
+
+
+class Tool1Input(ToolInput):
+    """Input for Tool1."""
+    param: str
+
+
+class Tool1(BaseTool):
+    """First of two tools with distinct schemas."""
+
+    name = "tool1"
+    description = "First tool"
+    input_schema = Tool1Input
+
+    async def execute(self, input_data: Tool1Input) -> ToolOutput:
+        return ToolOutput(result=f"tool1: {input_data.param}")
+
+
+class Tool2Input(ToolInput):
+    """Input for Tool2."""
+    value: str
+
+
+class Tool2(BaseTool):
+    """Second of two tools with distinct schemas."""
+
+    name = "tool2"
+    description = "Second tool"
+    input_schema = Tool2Input
+
+    async def execute(self, input_data: Tool2Input) -> ToolOutput:
+        return ToolOutput(result=f"tool2: {input_data.value}")
+
+
+@pytest.fixture(scope="session")
+def calculator_tool():
+    """Create one calculator shared by all tests; it keeps no state."""
+    return CalculatorTool()
+
+
+@pytest.fixture
+def registry():
+    """Create an empty tool registry."""
+    return ToolRegistry()
+
+
+@pytest.fixture
+def registry_with_calc(registry, calculator_tool):
+    """Create a registry with the calculator already registered."""
+    registry.register(calculator_tool)
+    return registry
+
+
+@pytest.fixture
+def mock_tool():
+    """Create a simple echo tool."""
+    return MockTool()
+
+
+class TestToolRegistry:
+    """Test cases for ToolRegistry."""
+
+    def test_initial_state(self, registry):
+        """Test that a new registry is empty."""
+        assert registry.get_all_tools() == []
+        assert registry.get_tool_names() == ()
+
+    def test_register_tool(self, registry, calculator_tool):
+        """Test registering a single tool."""
+        registry.register(calculator_tool)
+
+        tools = registry.get_all_tools()
+        assert len(tools) == 1
+        assert tools[0] is calculator_tool
+        assert registry.get_tool_names() == ("calculator",)
+
+    def test_register_multiple_tools(self, registry, calculator_tool, mock_tool):
+        """Test registering several tools in one batch."""
+        registry.register_many([calculator_tool, mock_tool])
+
+        assert registry.get_all_tools() == [calculator_tool, mock_tool]
+        assert set(registry.get_tool_names()) == {"calculator", "mock_tool"}
+
+    def test_register_many_runs_hooks(self, registry, calculator_tool, mock_tool):
+        """Test that batch registration runs the load hooks for each tool."""
+        pre_load, post_load = MagicMock(), MagicMock()
+        registry.add_pre_load_hook(pre_load)
+        registry.add_post_load_hook(post_load)
+
+        registry.register_many([calculator_tool, mock_tool])
+
+        assert pre_load.call_count == post_load.call_count == 2
+
+    def test_register_many_rejects_whole_batch(
+        self, registry_with_calc, calculator_tool, mock_tool
+    ):
+        """Test that one invalid tool leaves the registry unchanged."""
+        with pytest.raises(ToolRegistrationError, match="already registered"):
+            registry_with_calc.register_many([mock_tool, calculator_tool])
+
+        assert registry_with_calc.get_tool_names() == ("calculator",)
+
+    def test_register_many_rejects_duplicates_in_batch(self, registry):
+        """Test that a name repeated within a batch is rejected."""
+        with pytest.raises(ToolRegistrationError, match="more than once"):
+            registry.register_many([MockTool(), MockTool()])
+
+        assert registry.get_all_tools() == []
+
+    def test_register_duplicate_tool_raises(self, registry_with_calc, calculator_tool):
+        """Test that registering a name twice is rejected."""
+        with pytest.raises(ToolRegistrationError, match="already registered"):
+            registry_with_calc.register(calculator_tool)
+
+    def test_register_duplicate_tool_with_allow_replace(self, registry_with_calc):
+        """Test that allow_replace swaps in the new instance."""
+        replacement = CalculatorTool()
+        registry_with_calc.register(replacement, allow_replace=True)
+
+        assert registry_with_calc.get_all_tools() == [replacement]
+
+    def test_register_invalid_tool(self, registry):
+        """Test that objects not derived from BaseTool are rejected."""
+        with pytest.raises(ToolRegistrationError, match="must inherit from BaseTool"):
+            registry.register(object())
+
+    def test_register_tool_without_name(self, registry, mock_tool):
+        """Test that tools without a name are rejected."""
+        mock_tool.name = ""
+
+        with pytest.raises(ToolRegistrationError, match="must have a name"):
+            registry.register(mock_tool)
+
+    def test_get_tool_existing(self, registry_with_calc, calculator_tool):
+        """Test getting a registered tool."""
+        assert registry_with_calc.get_tool("calculator") is calculator_tool
+
+    def test_get_tool_nonexistent(self, registry):
+        """Test that getting an unknown tool raises."""
+        with pytest.raises(ToolNotFoundError, match="Tool not found: non_existent"):
+            registry.get_tool("non_existent")
+
+    def test_has_tool(self, registry_with_calc):
+        """Test checking whether a tool is registered."""
+        assert registry_with_calc.has_tool("calculator")
+        assert not registry_with_calc.has_tool("non_existent")
+
+    def test_contains(self, registry_with_calc):
+        """Test membership checks with the in operator."""
+        assert "calculator" in registry_with_calc
+        assert "non_existent" not in registry_with_calc
+
+    def test_unregister_tool(self, registry_with_calc):
+        """Test unregistering a tool."""
+        registry_with_calc.unregister("calculator")
+
+        assert "calculator" not in registry_with_calc
+        assert registry_with_calc.get_tool_names() == ()
+
+    def test_unregister_nonexistent(self, registry):
+        """Test that unregistering an unknown tool raises."""
+        with pytest.raises(ToolNotFoundError):
+            registry.unregister("non_existent")
+
+    def test_clear(self, registry_with_calc, mock_tool):
+        """Test removing all tools."""
+        registry_with_calc.register(mock_tool)
+        registry_with_calc.clear()
+
+        assert registry_with_calc.get_all_tools() == []
+
+    def test_get_tool_schemas(self, registry_with_calc):
+        """Test getting JSON schemas for registered tools."""
+        schemas = registry_with_calc.get_tool_schemas()
+
+        assert list(schemas) == ["calculator"]
+        assert "expression" in schemas["calculator"]["properties"]
+
+    def test_load_hooks(self, registry, calculator_tool):
+        """Test that load and unload hooks receive the tool."""
+        pre_load, post_load, pre_unload = MagicMock(), MagicMock(), MagicMock()
+        registry.add_pre_load_hook(pre_load)
+        registry.add_post_load_hook(post_load)
+        registry.add_pre_unload_hook(pre_unload)
+
+        registry.register(calculator_tool)
+        registry.unregister("calculator")
+
+        pre_load.assert_called_once_with(calculator_tool)
+        post_load.assert_called_once_with(calculator_tool)
+        pre_unload.assert_called_once_with(calculator_tool)
+
+    def test_post_load_hook_sees_updated_registry(self, registry, calculator_tool):
+        """Test that post-load hooks do not read stale cached views."""
+        seen = []
+        registry.get_tool_names()
+        registry.to_langchain_tools()
+        registry.add_post_load_hook(
+            lambda tool: seen.append(
+                (
+                    registry.get_tool_names(),
+                    [t.name for t in registry.to_langchain_tools()],
+                )
+            )
+        )
+
+        registry.register(calculator_tool)
+
+        assert seen == [(("calculator",), ["calculator"])]
+
+    def test_failing_hook_does_not_block_registration(self, registry, calculator_tool):
+        """Test that hook errors are logged rather than raised."""
+        registry.add_pre_load_hook(MagicMock(side_effect=RuntimeError("hook failed")))
+
+        registry.register(calculator_tool)
+
+        assert "calculator" in registry
+
+    def test_tool_registry_isolation(self, calculator_tool):
+        """Test that registries do not share tools."""
+        registry1 = ToolRegistry()
+        registry2 = ToolRegistry()
+
+        registry1.register(calculator_tool)
+
+        assert registry1.get_all_tools() == [calculator_tool]
+        assert registry2.get_all_tools() == []
+
+    def test_to_langchain_tools_empty(self, registry):
+        """Test converting an empty registry."""
+        assert registry.to_langchain_tools() == ()
+
+    def test_to_langchain_tools_single(self, registry_with_calc, calculator_tool):
+        """Test converting a single tool."""
+        langchain_tools = registry_with_calc.to_langchain_tools()
+
+        assert len(langchain_tools) == 1
+        langchain_tool = langchain_tools[0]
+        assert isinstance(langchain_tool, LangChainBaseTool)
+        assert langchain_tool.name == "calculator"
+        assert langchain_tool.description == calculator_tool.description
+
+    def test_to_langchain_tools_multiple(
+        self, registry_with_calc, calculator_tool, mock_tool
+    ):
+        """Test converting several tools."""
+        registry_with_calc.register(mock_tool)
+
+        langchain_tools = registry_with_calc.to_langchain_tools()
+        # Collect every checked attribute in a single pass over the wrappers
+        descriptions = {tool.name: tool.description for tool in langchain_tools}
+
+        assert len(langchain_tools) == 2
+        assert descriptions == {
+            "calculator": calculator_tool.description,
+            "mock_tool": mock_tool.description,
+        }
+
+    def test_get_tool_names_is_cached(self, registry_with_calc, mock_tool):
+        """Test that the names tuple is reused until the tool set changes."""
+        tool_names = registry_with_calc.get_tool_names()
+
+        assert registry_with_calc.get_tool_names() is tool_names
+
+        registry_with_calc.register(mock_tool)
+        assert registry_with_calc.get_tool_names() == ("calculator", "mock_tool")
+
+        registry_with_calc.unregister("calculator")
+        assert registry_with_calc.get_tool_names() == ("mock_tool",)
+
+    def test_to_langchain_tools_is_cached(self, registry_with_calc, mock_tool):
+        """Test that conversion is reused until the tool set changes."""
+        langchain_tools = registry_with_calc.to_langchain_tools()
+
+        assert registry_with_calc.to_langchain_tools() is langchain_tools
+        # Shared between callers, so it must not be mutable
+        assert isinstance(langchain_tools, tuple)
+
+        registry_with_calc.register(mock_tool)
+        langchain_tools = registry_with_calc.to_langchain_tools()
+        assert [tool.name for tool in langchain_tools] == ["calculator", "mock_tool"]
+
+        registry_with_calc.unregister("mock_tool")
+        langchain_tools = registry_with_calc.to_langchain_tools()
+        assert [tool.name for tool in langchain_tools] == ["calculator"]
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_langchain_tool_execution(self, registry_with_calc):
+        """Test invoking a converted tool."""
+        langchain_tool = registry_with_calc.to_langchain_tools()[0]
+        result = await langchain_tool.ainvoke({"expression": "2 + 2"})
+
+        assert result == "4"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_langchain_tool_error_handling(self, registry):
+        """Test that tool errors surface as exceptions from the wrapper."""
+        registry.register(ErrorTool())
+        langchain_tool = registry.to_langchain_tools()[0]
+
+        with pytest.raises(ValueError, match="Test error message"):
+            await langchain_tool.ainvoke({"param": "test"})
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_langchain_tool_wrapper_closure_issue(self, registry):
+        """Test that each wrapper calls its own tool, not the last one."""
+        registry.register_many([Tool1(), Tool2()])
+        langchain_tools = registry.to_langchain_tools()
+
+        result1, result2 = await asyncio.gather(
+            langchain_tools[0].ainvoke({"param": "test1"}),
+            langchain_tools[1].ainvoke({"value": "test2"}),
+        )
+
+        assert result1 == "tool1: test1"
+        assert result2 == "tool2: test2"
+
+
+class TestGlobalToolRegistry:
+    """Test cases for the global tool registry."""
+
+    def test_global_tool_registry_instance(self):
+        """Test that the global registry comes with the calculator."""
+        assert isinstance(tool_registry, ToolRegistry)
+        assert "calculator" in tool_registry
+        assert isinstance(tool_registry.get_tool("calculator"), CalculatorTool)
+
+    def test_global_registry_is_singleton(self):
+        """Test that the global registry is created once."""
+        assert get_tool_registry() is tool_registry
+        assert get_tool_registry() is get_tool_registry()
+
+    def test_set_tool_registry(self):
+        """Test replacing the global registry."""
+        original = get_tool_registry()
+        replacement = ToolRegistry()
+        try:
+            set_tool_registry(replacement)
+            assert get_tool_registry() is replacement
+        finally:
+            set_tool_registry(original)